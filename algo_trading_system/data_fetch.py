@@ -1,9 +1,15 @@
 from __future__ import annotations
 
+import asyncio
 import datetime as _dt
+import importlib.util
 import io
 import logging
-from typing import Dict, Iterable, Optional
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
 import pandas as pd
 
 try:
@@ -12,28 +18,116 @@ try:
 except ImportError:
     _HAS_YFINANCE = False
 
+try:
+    import httpx
+    _HAS_HTTPX = True
+    # HTTP/2 lets concurrent symbol requests share one TLS connection, it needs the optional h2 package
+    _HAS_HTTP2 = importlib.util.find_spec("h2") is not None
+except ImportError:
+    _HAS_HTTPX = False
+    _HAS_HTTP2 = False
+
+_HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
 
 logger = logging.getLogger(__name__)
 
 MAX_RETRIES = 3
 RETRY_DELAY_SECONDS = 5
+MAX_WORKERS = 8
+REQUEST_TIMEOUT_SECONDS = 10
+
+# Shared session so repeated downloads reuse pooled keep-alive connections instead of a new TLS handshake each
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=Retry(total=3, backoff_factor=0.5)),
+)
+
+# On-disk cache of yfinance downloads, reused until the TTL for the interval expires
+CACHE_DIR = Path(os.environ.get("ALGO_TRADING_CACHE_DIR", "~/.cache/algo_trading")).expanduser()
+INTRADAY_CACHE_TTL_SECONDS = 4 * 60 * 60
+DAILY_CACHE_TTL_SECONDS = 24 * 60 * 60
+
+# In-process memo of non-empty yfinance downloads, the oldest entry is evicted beyond MEMO_MAXSIZE
+MEMO_MAXSIZE = 128
+_MEMO: Dict[Tuple[str, str, str, str], pd.DataFrame] = {}
+_MEMO_LOCK = threading.Lock()
+
 
+def _cache_path(symbol: str, start_date: str, end_date: str, interval: str) -> Path:
+    return CACHE_DIR / f"{symbol}_{start_date}_{end_date}_{interval}.parquet"
+
+
+# Returns the cached DataFrame if the file exists and is younger than the TTL for its interval
+def _read_cache(path: Path, interval: str) -> Optional[pd.DataFrame]:
+    # Minute and hour bars ('1m', '60m', '1h', ...) go stale faster than daily and longer bars
+    ttl = INTRADAY_CACHE_TTL_SECONDS if interval.endswith(('m', 'h')) else DAILY_CACHE_TTL_SECONDS
+    try:
+        if time.time() - path.stat().st_mtime > ttl:
+            return None
+        return pd.read_parquet(path)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.debug("Ignoring unreadable cache file %s: %s", path, e)
+        return None
+
+
+def _write_cache(path: Path, data: pd.DataFrame) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data.to_parquet(path)
+    except Exception as e:
+        # Caching is best effort, e.g. no parquet engine installed or read-only home directory
+        logger.debug("Could not write cache file %s: %s", path, e)
+
+
+# Downloads historical data using yfinance, memoising non-empty results per process. Callers get a copy.
 def _download_via_yfinance(symbol: str, start_date: str, end_date: str, interval: str = '1d') -> pd.DataFrame:
-    # Downloads historical data using yfinance.
     if not _HAS_YFINANCE:
         raise ImportError(
             "yfinance is not installed. Install it via `pip install yfinance` to use this function"
         )
+    key = (symbol, start_date, end_date, interval)
+    with _MEMO_LOCK:
+        data = _MEMO.get(key)
+    if data is None:
+        data = _download_yfinance_uncached(symbol, start_date, end_date, interval)
+        # Empty results are not memoised, so a transient empty response is retried on the next call
+        if data.empty:
+            return data
+        with _MEMO_LOCK:
+            _MEMO[key] = data
+            while len(_MEMO) > MEMO_MAXSIZE:
+                del _MEMO[next(iter(_MEMO))]
+    return data.copy()
+
+
+# Reads the on-disk cache or downloads from yfinance, writing non-empty results back to disk
+def _download_yfinance_uncached(symbol: str, start_date: str, end_date: str, interval: str) -> pd.DataFrame:
+    cache_path = _cache_path(symbol, start_date, end_date, interval)
+    cached = _read_cache(cache_path, interval)
+    if cached is not None:
+        logger.debug("Loaded %s data from cache %s", symbol, cache_path)
+        return cached
     logger.debug("Downloading %s data from yfinance from %s to %s", symbol, start_date, end_date)
     for attempt in range(MAX_RETRIES):
         try:
-            data = yf.download(symbol, start=start_date, end=end_date, interval=interval, auto_adjust=True)
-            if not data.empty:
-                data.columns = [col[0] if isinstance(col, tuple) else col for col in data.columns]
+            # Ticker.history keeps no module-level state, unlike yf.download, so it is safe to call from worker threads
+            data = yf.Ticker(symbol).history(
+                start=start_date, end=end_date, interval=interval, auto_adjust=True, actions=False
+            )
+            if not data.empty and data.index.tz is not None:
+                data.index = data.index.tz_localize(None)
             if data.empty:
                 logger.warning("No data returned for %s using yfinance", symbol)
+            else:
+                _write_cache(cache_path, data)
             return data
         except Exception as e:
             logger.warning("yfinance download failed for %s (attempt %d/%d): %s", symbol, attempt + 1, MAX_RETRIES, e)
@@ -43,6 +137,37 @@ def _download_via_yfinance(symbol: str, start_date: str, end_date: str, interval
                 raise
     return pd.DataFrame() 
 
+def _csv_url(symbol: str, start_date: str, end_date: str, interval: str) -> str:
+    # Convert dates into Unix timestamps
+    start_ts = int(_dt.datetime.strptime(start_date, "%Y-%m-%d").timestamp())
+    end_ts = int(_dt.datetime.strptime(end_date, "%Y-%m-%d").timestamp())
+    return (
+        f"https://query1.finance.yahoo.com/v7/finance/download/{symbol}"
+        f"?period1={start_ts}&period2={end_ts}&interval={interval}&events=history&includeAdjustedClose=true"
+    )
+
+
+# Parse CSV to DataFrame, using the multi-threaded pyarrow parser when it is installed
+def _parse_csv(content: str) -> pd.DataFrame:
+    header = content.split("\n", 1)[0]
+    has_date = "Date" in [col.strip().strip('"') for col in header.split(",")]
+    if _HAS_PYARROW:
+        try:
+            data = pd.read_csv(
+                io.StringIO(content), engine="pyarrow", parse_dates=["Date"] if has_date else None
+            )
+            # index_col would skip pyarrow's native date parsing, so the index is set afterwards
+            return data.set_index("Date") if has_date else data
+        except (ImportError, ValueError) as e:
+            logger.debug("pyarrow CSV parsing failed (%s), falling back to the C parser", e)
+    return pd.read_csv(
+        io.StringIO(content),
+        parse_dates=["Date"] if has_date else None,
+        index_col="Date" if has_date else None,
+        cache_dates=True,
+    )
+
+
 # If yfinance fails or is not available
 def _download_via_csv(symbol: str, start_date: str, end_date: str, interval: str = '1d') -> pd.DataFrame:
     #Fallback method to download data using Yahoo Finance's CSV endpoint
@@ -53,25 +178,12 @@ def _download_via_csv(symbol: str, start_date: str, end_date: str, interval: str
         end_date,
         interval,
     )
+    url = _csv_url(symbol, start_date, end_date, interval)
     for attempt in range(MAX_RETRIES):
         try:
-            # Convert dates into Unix timestamps
-            start_ts = int(_dt.datetime.strptime(start_date, "%Y-%m-%d").timestamp())
-            end_ts = int(_dt.datetime.strptime(end_date, "%Y-%m-%d").timestamp())
-            url = (
-                f"https://query1.finance.yahoo.com/v7/finance/download/{symbol}"
-                f"?period1={start_ts}&period2={end_ts}&interval={interval}&events=history&includeAdjustedClose=true"
-            )
-            response = requests.get(url)
+            response = _SESSION.get(url, timeout=REQUEST_TIMEOUT_SECONDS)
             response.raise_for_status()
-            content = response.text
-
-            # Parse CSV to DataFrame
-            data = pd.read_csv(io.StringIO(content))
-            if not data.empty and 'Date' in data.columns:
-                data['Date'] = pd.to_datetime(data['Date'])
-                data = data.set_index('Date')
-            return data
+            return _parse_csv(response.text)
         except requests.exceptions.RequestException as e:
             logger.warning("CSV download failed for %s (attempt %d/%d): %s", symbol, attempt + 1, MAX_RETRIES, e)
             if attempt < MAX_RETRIES - 1:
@@ -80,37 +192,114 @@ def _download_via_csv(symbol: str, start_date: str, end_date: str, interval: str
                 raise
     return pd.DataFrame() 
 
+# Async variant of _download_via_csv sharing one httpx client across all symbols
+async def _download_via_csv_async(
+    client: "httpx.AsyncClient",
+    symbol: str,
+    start_date: str,
+    end_date: str,
+    interval: str = '1d',
+) -> pd.DataFrame:
+    for attempt in range(MAX_RETRIES):
+        try:
+            response = await client.get(_csv_url(symbol, start_date, end_date, interval))
+            response.raise_for_status()
+            return _parse_csv(response.text)
+        except httpx.HTTPError as e:
+            logger.warning("CSV download failed for %s (attempt %d/%d): %s", symbol, attempt + 1, MAX_RETRIES, e)
+            if attempt < MAX_RETRIES - 1:
+                await asyncio.sleep(RETRY_DELAY_SECONDS)
+            else:
+                logger.error("Data download failed for %s: %s", symbol, e)
+        except Exception as e:
+            # Errors such as an unparseable body only fail this symbol, not the whole gather
+            logger.error("Data download failed for %s: %s", symbol, e)
+            break
+    return pd.DataFrame()
+
+
+async def fetch_stock_data_async(
+    symbols: Iterable[str],
+    start_date: str,
+    end_date: Optional[str] = None,
+    interval: str = '1d',
+) -> Dict[str, pd.DataFrame]:
+    #Fetch historical market data from the CSV endpoint with all symbol requests in flight at once
+    if not _HAS_HTTPX:
+        raise ImportError(
+            "httpx is not installed. Install it via `pip install httpx` to use this function"
+        )
+    if end_date is None:
+        end_date = _dt.date.today().isoformat()
+    symbols = list(symbols)
+    async with httpx.AsyncClient(
+        http2=_HAS_HTTP2,
+        limits=httpx.Limits(max_connections=16),
+        timeout=REQUEST_TIMEOUT_SECONDS,
+    ) as client:
+        frames = await asyncio.gather(
+            *(_download_via_csv_async(client, sym, start_date, end_date, interval) for sym in symbols)
+        )
+    return dict(zip(symbols, frames))
+
+
+def _in_event_loop() -> bool:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+# Downloads a single symbol, falling back to the CSV endpoint if yfinance fails
+def _fetch_symbol(
+    sym: str,
+    start_date: str,
+    end_date: str,
+    interval: str,
+    prefer_yfinance: bool,
+) -> pd.DataFrame:
+    try:
+        if prefer_yfinance and _HAS_YFINANCE:
+            return _download_via_yfinance(sym, start_date, end_date, interval=interval)
+        return _download_via_csv(sym, start_date, end_date, interval=interval)
+    except Exception as e:
+        # Attempt fallback if yfinance fails
+        if prefer_yfinance and _HAS_YFINANCE:
+            logger.warning(
+                "yfinance download failed for %s (%s). Falling back to CSV endpoint.", sym, e
+            )
+            try:
+                return _download_via_csv(sym, start_date, end_date, interval=interval)
+            except Exception as csv_e:
+                logger.error("CSV fallback also failed for %s: %s", sym, csv_e)
+                return pd.DataFrame()
+        logger.error("Data download failed for %s: %s", sym, e)
+        return pd.DataFrame()
+
+
 def fetch_stock_data(
     symbols: Iterable[str],
     start_date: str,
     end_date: Optional[str] = None,
     interval: str = '1d',
     prefer_yfinance: bool = True,
+    max_workers: int = MAX_WORKERS,
 ) -> Dict[str, pd.DataFrame]:
-    #Fetch historical market data for a list of symbols
+    #Fetch historical market data for a list of symbols, downloading them concurrently
 
     if end_date is None:
         end_date = _dt.date.today().isoformat()
-    results: Dict[str, pd.DataFrame] = {}
-    for sym in symbols:
-        try:
-            if prefer_yfinance and _HAS_YFINANCE:
-                df = _download_via_yfinance(sym, start_date, end_date, interval=interval)
-            else:
-                df = _download_via_csv(sym, start_date, end_date, interval=interval)
-        except Exception as e:
-            # Attempt fallback if yfinance fails
-            if prefer_yfinance and _HAS_YFINANCE:
-                logger.warning(
-                    "yfinance download failed for %s (%s). Falling back to CSV endpoint.", sym, e
-                )
-                try:
-                    df = _download_via_csv(sym, start_date, end_date, interval=interval)
-                except Exception as csv_e:
-                    logger.error("CSV fallback also failed for %s: %s", sym, csv_e)
-                    df = pd.DataFrame() 
-            else:
-                logger.error("Data download failed for %s: %s", sym, e)
-                df = pd.DataFrame() 
-        results[sym] = df
+    symbols = list(symbols)
+    if not symbols:
+        return {}
+    # CSV-only downloads go through the async client, unless called from inside a running event loop
+    if not (prefer_yfinance and _HAS_YFINANCE) and _HAS_HTTPX and not _in_event_loop():
+        return asyncio.run(fetch_stock_data_async(symbols, start_date, end_date, interval=interval))
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(symbols))) as pool:
+        frames = pool.map(
+            lambda sym: _fetch_symbol(sym, start_date, end_date, interval, prefer_yfinance),
+            symbols,
+        )
+        results: Dict[str, pd.DataFrame] = dict(zip(symbols, frames))
     return results
\ No newline at end of file
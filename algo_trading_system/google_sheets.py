@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 import logging
+from typing import List
+import numpy as np
 import pandas as pd
 
 try:
     import gspread  
-    from gspread_dataframe import set_with_dataframe  
     from oauth2client.service_account import ServiceAccountCredentials  
     _HAS_GSPREAD = True
 except ImportError:
@@ -13,6 +14,31 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Cells sent per values.update request, large frames are written in row chunks below this size
+MAX_CELLS_PER_REQUEST = 50000
+
+
+# Converts a DataFrame into the header + rows list of lists sent to the Sheets API.
+# Numbers stay numeric, other values (dates, symbols) become text and missing or infinite values become empty cells.
+def _frame_to_values(df: pd.DataFrame) -> List[List[object]]:
+    columns = []
+    empty = []
+    for _, col in df.items():
+        if pd.api.types.is_numeric_dtype(col) and not pd.api.types.is_bool_dtype(col):
+            numeric = col.to_numpy(dtype=np.float64, na_value=np.nan)
+            columns.append(col.astype(object).to_numpy())
+            empty.append(~np.isfinite(numeric))
+        else:
+            columns.append(col.astype(str).to_numpy(dtype=object))
+            empty.append(col.isna().to_numpy())
+    if columns:
+        rows = np.column_stack(columns)
+        rows[np.column_stack(empty)] = ""
+        body = rows.tolist()
+    else:
+        body = [[] for _ in range(len(df))]
+    return [[str(c) for c in df.columns]] + body
+
 
 class GoogleSheetsLogger:
     # Initializes the Google Sheets logger with credentials and spreadsheet name
@@ -46,11 +72,24 @@ class GoogleSheetsLogger:
             except gspread.exceptions.WorksheetNotFound:
                 worksheet = self.sheet.add_worksheet(title=worksheet_title, rows=1000, cols=20)
 
+            values = _frame_to_values(df)
+            n_rows = len(values)
+            n_cols = max(len(df.columns), 1)
+            # Grow the grid up front, updates outside the sheet's current size are rejected
+            if worksheet.row_count < n_rows or worksheet.col_count < n_cols:
+                worksheet.resize(rows=max(worksheet.row_count, n_rows), cols=max(worksheet.col_count, n_cols))
+
             # Clear existing contents
             worksheet.clear()
 
-            # Use gspread_dataframe helper to write DataFrame
-            set_with_dataframe(worksheet, df, include_index=False)
+            # One batched values.update per chunk instead of per-cell writes
+            rows_per_request = max(1, MAX_CELLS_PER_REQUEST // n_cols)
+            for start in range(0, n_rows, rows_per_request):
+                worksheet.update(
+                    values=values[start:start + rows_per_request],
+                    range_name=f"A{start + 1}",
+                    value_input_option='RAW',
+                )
             logger.info("Wrote %d rows to worksheet '%s'", len(df), worksheet_title)
         except Exception as exc:
             logger.error("Failed to write DataFrame to Google Sheets: %s", exc)
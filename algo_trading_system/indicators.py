@@ -2,19 +2,100 @@ from __future__ import annotations
 
 import pandas as pd
 import numpy as np
-from typing import Tuple
+from typing import Dict, Optional, Tuple
+
+try:
+    from numba import njit
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
+
+try:
+    import polars as pl
+    _HAS_POLARS = True
+except ImportError:
+    _HAS_POLARS = False
+
+RSI_PERIOD = 14
+
+# Casts a series to the requested dtype, e.g. np.float32 to halve the memory traffic of feature columns
+def _cast(series: pd.Series, dtype: Optional[np.dtype]) -> pd.Series:
+    if dtype is None:
+        return series
+    return series.astype(dtype, copy=False)
 
 # Calculate Simple Moving Average (SMA)
-def calculate_sma(series: pd.Series, window: int) -> pd.Series:
-    return series.rolling(window=window, min_periods=window).mean()
+def calculate_sma(series: pd.Series, window: int, dtype: Optional[np.dtype] = None) -> pd.Series:
+    return _cast(_cast(series, dtype).rolling(window=window, min_periods=window).mean(), dtype)
 
 # Calculate Exponential Moving Average (EMA)
-def calculate_ema(series: pd.Series, window: int) -> pd.Series:
-    return series.ewm(span=window, adjust=False).mean()
+def calculate_ema(series: pd.Series, window: int, dtype: Optional[np.dtype] = None) -> pd.Series:
+    return _cast(_cast(series, dtype).ewm(span=window, adjust=False).mean(), dtype)
+
+if _HAS_NUMBA:
+    # Exponentially weighted mean with the same semantics as pandas' ewm(...).mean() (ignore_na=False)
+    @njit(cache=True, nogil=True, error_model="numpy")
+    def _ewm_mean(values, alpha, adjust, min_periods):
+        n = values.shape[0]
+        out = np.empty(n, dtype=np.float64)
+        if n == 0:
+            return out
+        old_wt_factor = 1.0 - alpha
+        new_wt = 1.0 if adjust else alpha
+        weighted = values[0]
+        nobs = 1 if weighted == weighted else 0
+        out[0] = weighted if nobs >= min_periods else np.nan
+        old_wt = 1.0
+        for i in range(1, n):
+            cur = values[i]
+            is_obs = cur == cur
+            if is_obs:
+                nobs += 1
+            if weighted == weighted:
+                old_wt *= old_wt_factor
+                if is_obs:
+                    if weighted != cur:
+                        weighted = (old_wt * weighted + new_wt * cur) / (old_wt + new_wt)
+                    if adjust:
+                        old_wt += new_wt
+                    else:
+                        old_wt = 1.0
+            elif is_obs:
+                weighted = cur
+            out[i] = weighted if nobs >= min_periods else np.nan
+        return out
+
+    # RSI from gains/losses smoothed with Wilder's factor 1/period, in a single compiled pass per average
+    @njit(cache=True, nogil=True, error_model="numpy")
+    def _wilder_rsi(close, period):
+        n = close.shape[0]
+        gain = np.empty(n, dtype=np.float64)
+        loss = np.empty(n, dtype=np.float64)
+        if n > 0:
+            gain[0] = np.nan
+            loss[0] = np.nan
+        for i in range(1, n):
+            delta = close[i] - close[i - 1]
+            if delta != delta:
+                gain[i] = np.nan
+                loss[i] = np.nan
+            elif delta > 0:
+                gain[i] = delta
+                loss[i] = 0.0
+            else:
+                gain[i] = 0.0
+                loss[i] = -delta
+        avg_gain = _ewm_mean(gain, 1.0 / period, True, max(period, 1))
+        avg_loss = _ewm_mean(loss, 1.0 / period, True, max(period, 1))
+        return 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+
 
 # Calculate Relative Strength Index (RSI)
-def calculate_rsi(series: pd.Series, period: int = 14) -> pd.Series:
-    delta = series.diff()
+def calculate_rsi(series: pd.Series, period: int = 14, dtype: Optional[np.dtype] = None) -> pd.Series:
+    if _HAS_NUMBA:
+        rsi = _wilder_rsi(series.to_numpy(dtype=np.float64), period)
+        return _cast(pd.Series(rsi, index=series.index, name=series.name), dtype)
+    delta = _cast(series, dtype).diff()
     gain = delta.clip(lower=0)
     loss = -delta.clip(upper=0)
     # Wilder's smoothing 
@@ -22,7 +103,7 @@ def calculate_rsi(series: pd.Series, period: int = 14) -> pd.Series:
     avg_loss = loss.ewm(alpha=1 / period, min_periods=period).mean()
     rs = avg_gain / avg_loss
     rsi = 100 - (100 / (1 + rs))
-    return rsi
+    return _cast(rsi, dtype)
 
 # Calculate Moving Average Convergence Divergence (MACD)
 def calculate_macd(
@@ -30,11 +111,184 @@ def calculate_macd(
     fast: int = 12,
     slow: int = 26,
     signal: int = 9,
+    dtype: Optional[np.dtype] = None,
 ) -> Tuple[pd.Series, pd.Series, pd.Series]:
 # Calculate MACD line, Signal line, and Histogram
-    ema_fast = calculate_ema(series, fast)
-    ema_slow = calculate_ema(series, slow)
+    ema_fast = calculate_ema(series, fast, dtype=dtype)
+    ema_slow = calculate_ema(series, slow, dtype=dtype)
     macd_line = ema_fast - ema_slow
-    signal_line = macd_line.ewm(span=signal, adjust=False).mean()
+    signal_line = calculate_ema(macd_line, signal, dtype=dtype)
     histogram = macd_line - signal_line
-    return macd_line, signal_line, histogram
\ No newline at end of file
+    return macd_line, signal_line, histogram
+
+# Indicator columns computed with pandas rolling/ewm operations
+def _pandas_indicator_columns(close: pd.Series, volume: pd.Series) -> Dict[str, pd.Series]:
+    rsi = calculate_rsi(close, period=RSI_PERIOD)
+    macd_line, signal_line, hist = calculate_macd(close)
+    return {
+        'rsi': rsi,
+        'sma10': calculate_sma(close, 10),
+        'sma20': calculate_sma(close, 20),
+        'sma50': calculate_sma(close, 50),
+        'macd_line': macd_line,
+        'macd_signal': signal_line,
+        'macd_hist': hist,
+        # Adding lag features
+        'rsi_lag1': rsi.shift(1),
+        'macd_hist_lag1': hist.shift(1),
+        'close_lag1': close.shift(1),
+        # Adding ROC
+        'roc': close.pct_change(periods=3),
+        # Adding rolling volatility
+        'volatility': close.rolling(window=5).std(),
+        # Adding volume based features
+        'vol_change': volume.pct_change(),
+        'vol_sma10': volume.rolling(10).mean(),
+    }
+
+# Same indicator columns evaluated as one lazy polars query on its multi-threaded Rust kernels (polars>=1.21)
+def _polars_indicator_columns(close: pd.Series, volume: pd.Series) -> Dict[str, np.ndarray]:
+    frame = pl.DataFrame(
+        {'close': close.to_numpy(dtype=np.float64), 'volume': volume.to_numpy(dtype=np.float64)},
+        nan_to_null=True,
+    )
+    c = pl.col('close')
+    v = pl.col('volume')
+    delta = c.diff()
+    alpha = 1 / RSI_PERIOD
+    # polars leaves missing inputs null where pandas carries the last average forward
+    avg_gain = delta.clip(lower_bound=0).ewm_mean(alpha=alpha, adjust=True, min_samples=RSI_PERIOD).forward_fill()
+    avg_loss = (-delta.clip(upper_bound=0)).ewm_mean(alpha=alpha, adjust=True, min_samples=RSI_PERIOD).forward_fill()
+    rsi = 100 - 100 / (1 + avg_gain / avg_loss)
+    macd_line = c.ewm_mean(span=12, adjust=False).forward_fill() - c.ewm_mean(span=26, adjust=False).forward_fill()
+    signal_line = macd_line.ewm_mean(span=9, adjust=False).forward_fill()
+    hist = macd_line - signal_line
+    result = frame.lazy().select(
+        rsi.alias('rsi'),
+        c.rolling_mean(10, min_samples=10).alias('sma10'),
+        c.rolling_mean(20, min_samples=20).alias('sma20'),
+        c.rolling_mean(50, min_samples=50).alias('sma50'),
+        macd_line.alias('macd_line'),
+        signal_line.alias('macd_signal'),
+        hist.alias('macd_hist'),
+        rsi.shift(1).alias('rsi_lag1'),
+        hist.shift(1).alias('macd_hist_lag1'),
+        c.shift(1).alias('close_lag1'),
+        c.pct_change(3).alias('roc'),
+        c.rolling_std(5).alias('volatility'),
+        v.pct_change().alias('vol_change'),
+        v.rolling_mean(10).alias('vol_sma10'),
+    ).collect()
+    return {name: result[name].to_numpy() for name in result.columns}
+
+# Output order of the rows written by the Numba kernel batch
+_BATCH_COLUMNS = (
+    'rsi', 'sma10', 'sma20', 'sma50', 'macd_line', 'macd_signal', 'macd_hist',
+    'rsi_lag1', 'macd_hist_lag1', 'close_lag1', 'roc', 'volatility', 'vol_change', 'vol_sma10',
+)
+
+if _HAS_NUMBA:
+    # Rolling mean over the non-NaN values of each window, like pandas' rolling(window, min_periods).mean()
+    @njit(cache=True, nogil=True)
+    def _rolling_mean(values, window, min_periods):
+        n = values.shape[0]
+        out = np.empty(n, dtype=np.float64)
+        total = 0.0
+        count = 0
+        for i in range(n):
+            if values[i] == values[i]:
+                total += values[i]
+                count += 1
+            if i >= window and values[i - window] == values[i - window]:
+                total -= values[i - window]
+                count -= 1
+            out[i] = total / count if count >= min_periods and count > 0 else np.nan
+        return out
+
+    # Sample standard deviation (ddof=1) of full windows, like pandas' rolling(window).std()
+    @njit(cache=True, nogil=True)
+    def _rolling_std(values, window):
+        n = values.shape[0]
+        out = np.full(n, np.nan)
+        for i in range(window - 1, n):
+            mean = 0.0
+            for j in range(i - window + 1, i + 1):
+                mean += values[j]
+            mean /= window
+            sq = 0.0
+            for j in range(i - window + 1, i + 1):
+                sq += (values[j] - mean) ** 2
+            out[i] = np.sqrt(sq / (window - 1))
+        return out
+
+    @njit(cache=True, nogil=True)
+    def _shift1(values):
+        out = np.empty_like(values)
+        if values.shape[0] > 0:
+            out[0] = np.nan
+            out[1:] = values[:-1]
+        return out
+
+    @njit(cache=True, nogil=True, error_model="numpy")
+    def _pct_change(values, periods):
+        out = np.full(values.shape[0], np.nan)
+        for i in range(periods, values.shape[0]):
+            out[i] = values[i] / values[i - periods] - 1.0
+        return out
+
+    # Opt-in batch of the kernels above, run from one compiled call with one pass per column group.
+    # It runs single-threaded without the GIL, run_demo's per-symbol thread pool provides the parallelism.
+    # Rows of out follow _BATCH_COLUMNS.
+    @njit(cache=True, nogil=True, error_model="numpy")
+    def _batch_indicators(close, volume, rsi_period, out):
+        rsi = _wilder_rsi(close, rsi_period)
+        out[0] = rsi
+        out[1] = _rolling_mean(close, 10, 10)
+        out[2] = _rolling_mean(close, 20, 20)
+        out[3] = _rolling_mean(close, 50, 50)
+        macd_line = _ewm_mean(close, 2.0 / 13.0, False, 1) - _ewm_mean(close, 2.0 / 27.0, False, 1)
+        signal_line = _ewm_mean(macd_line, 2.0 / 10.0, False, 1)
+        hist = macd_line - signal_line
+        out[4] = macd_line
+        out[5] = signal_line
+        out[6] = hist
+        out[7] = _shift1(rsi)
+        out[8] = _shift1(hist)
+        out[9] = _shift1(close)
+        out[10] = _pct_change(close, 3)
+        out[11] = _rolling_std(close, 5)
+        out[12] = _pct_change(volume, 1)
+        out[13] = _rolling_mean(volume, 10, 10)
+
+
+# Same indicator columns from the Numba kernel batch, converting Close and Volume once into preallocated rows
+def _numba_indicator_columns(close: pd.Series, volume: pd.Series) -> Dict[str, np.ndarray]:
+    close_values = close.to_numpy(dtype=np.float64)
+    out = np.empty((len(_BATCH_COLUMNS), len(close_values)), dtype=np.float64)
+    _batch_indicators(close_values, volume.to_numpy(dtype=np.float64), RSI_PERIOD, out)
+    return dict(zip(_BATCH_COLUMNS, out))
+
+# Computes every indicator used by the strategy and the ML features once, so both can share the enriched frame
+# backend is 'pandas', 'numba' or 'polars'. pandas is the default. With numba installed it still uses the
+# small compiled RSI kernel, whose JIT cost is paid once per process and cached on disk. The numba backend
+# compiles a much larger kernel batch, seconds on a cold cache for a few milliseconds saved per call on
+# run_demo's short daily frames, so it is opt-in, as is polars.
+def compute_indicators(df: pd.DataFrame, backend: str = 'pandas') -> pd.DataFrame:
+    if backend == 'numba':
+        if not _HAS_NUMBA:
+            raise ImportError(
+                "numba is not installed. Install it via `pip install numba` to use the numba backend"
+            )
+        cols = _numba_indicator_columns(df['Close'], df['Volume'])
+    elif backend == 'pandas':
+        cols = _pandas_indicator_columns(df['Close'], df['Volume'])
+    elif backend == 'polars':
+        if not _HAS_POLARS:
+            raise ImportError(
+                "polars is not installed. Install it via `pip install polars` to use the polars backend"
+            )
+        cols = _polars_indicator_columns(df['Close'], df['Volume'])
+    else:
+        raise ValueError(f"Unknown indicator backend: {backend!r}")
+    # Columns are collected first and attached with a single assign, leaving the input frame untouched
+    return df.assign(**cols)
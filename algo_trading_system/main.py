@@ -2,13 +2,15 @@ from __future__ import annotations
 
 import logging
 import os
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Tuple
 import pandas as pd
 from datetime import datetime
 from dateutil.relativedelta import relativedelta
 from .data_fetch import fetch_stock_data
+from .indicators import compute_indicators
 from .strategy import generate_signals, backtest_signals
-from .ml_model import prepare_features, train_models
+from .ml_model import InsufficientDataError, prepare_features, train_models
 from .telegram_notifier import send_telegram_message
 
 try:
@@ -23,12 +25,44 @@ load_dotenv()
 
 TELEGRAM_TOKEN = os.getenv("TELEGRAM_TOKEN")
 CHAT_ID = os.getenv("CHAT_ID")
+MAX_WORKERS = 8
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s [%(levelname)s] %(name)s: %(message)s')
 logger = logging.getLogger(__name__)
 
 
+# Runs the strategy, backtest and ML models for a single symbol
+def _process_symbol(sym: str, df: pd.DataFrame) -> Tuple[Dict[str, float], pd.DataFrame, pd.DataFrame]:
+    logger.info("Processing %s", sym)
+    # Droping rows with missing values
+    df = df.dropna(subset=["Close", "Volume"])
+    # Indicators are computed once and shared by the strategy and the ML features
+    df = compute_indicators(df)
+    df_signals = generate_signals(df)
+    trades_df, summary = backtest_signals(df_signals)
+    summary['symbol'] = sym
+    trades_df['symbol'] = sym
+    df_signals['symbol'] = sym
+
+    # Machine-learning component
+    try:
+        X, y = prepare_features(df)
+        metrics = train_models(X, y)
+        summary.update(metrics)
+        logger.info(
+            "%s: logistic_accuracy=%.3f, tree_accuracy=%.3f",
+            sym,
+            metrics['logistic_accuracy'],
+            metrics['tree_accuracy'],
+        )
+    except InsufficientDataError as e:
+        logger.info("ML training skipped for %s: %s", sym, e)
+    except Exception as e:
+        logger.warning("ML training skipped for %s due to error: %s", sym, e)
+    return summary, trades_df, df_signals
+
+
 def run_demo(symbols: List[str], start_date: str, end_date: str, log_to_sheets: bool = False) -> None:
     try:
         send_telegram_message(f"Algo-trading system started for symbols: {', '.join(symbols)}")
@@ -47,36 +81,21 @@ def run_demo(symbols: List[str], start_date: str, end_date: str, log_to_sheets:
                 "GOOGLE_CREDENTIALS_JSON and GOOGLE_SHEET_NAME environment variables must be set to log to Sheets."
             )
         sheets_logger = GoogleSheetsLogger(creds_path, sheet_name)
-    all_trades = pd.DataFrame()
+    # Processing the stocks concurrently, each one independently of the others
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+        results = list(pool.map(_process_symbol, data.keys(), data.values()))
+    # Accumulating the per-symbol frames so each output is concatenated only once
     summary_rows = []
-    # Processing each stock individually
-    for sym, df in data.items():
-        logger.info("Processing %s", sym)
-        # Droping rows with missing values
-        df = df.dropna(subset=["Close", "Volume"])
-        df_signals = generate_signals(df)
-        trades_df, summary = backtest_signals(df_signals)
-        summary['symbol'] = sym
+    trades_list: List[pd.DataFrame] = []
+    signals_list: List[pd.DataFrame] = []
+    for summary, trades_df, df_signals in results:
         summary_rows.append(summary)
-        trades_df['symbol'] = sym
-        all_trades = pd.concat([all_trades, trades_df], ignore_index=True)
-
-        # Machine-learning component
-        try:
-            X, y = prepare_features(df)
-            metrics = train_models(X, y)
-            summary.update(metrics)
-            logger.info(
-                "%s: logistic_accuracy=%.3f, tree_accuracy=%.3f",
-                sym,
-                metrics['logistic_accuracy'],
-                metrics['tree_accuracy'],
-            )
-        except Exception as e:
-            logger.warning("ML training skipped for %s due to error: %s", sym, e)
-        # Optionally log signals
-        if sheets_logger:
-            sheets_logger.log_signals(df_signals.reset_index())
+        trades_list.append(trades_df)
+        signals_list.append(df_signals.reset_index())
+    all_trades = pd.concat(trades_list, ignore_index=True) if trades_list else pd.DataFrame()
+    # Optionally log signals of all symbols in a single write
+    if sheets_logger and signals_list:
+        sheets_logger.log_signals(pd.concat(signals_list, ignore_index=True))
     # Summary DataFrame
     summary_df = pd.DataFrame(summary_rows)
     logger.debug("Completed processing! Summary:\n%s", summary_df)
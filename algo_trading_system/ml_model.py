@@ -4,7 +4,7 @@ import logging
 from typing import Tuple, Dict
 import pandas as pd
 import numpy as np
-from .indicators import calculate_rsi, calculate_macd, calculate_sma
+from .indicators import compute_indicators
 
 from sklearn.model_selection import TimeSeriesSplit
 from sklearn.metrics import accuracy_score, precision_score, recall_score, f1_score, roc_auc_score
@@ -14,42 +14,41 @@ from sklearn.preprocessing import StandardScaler
 
 logger = logging.getLogger(__name__)
 
+# Fewer rows than this after dropping indicator warm-up NaNs leave too little data for cross-validation
+MIN_TRAINING_ROWS = 60
 
-def prepare_features(df: pd.DataFrame) -> Tuple[pd.DataFrame, pd.Series]:
-    df = df.copy()
-    # Computing the indicators
-    df['rsi'] = calculate_rsi(df['Close'])
-    df['sma10'] = calculate_sma(df['Close'], 10)
-    df['sma20'] = calculate_sma(df['Close'], 20)
-    df['sma50'] = calculate_sma(df['Close'], 50)
-    macd_line, signal_line, hist = calculate_macd(df['Close'])
-    df['macd_line'] = macd_line
-    df['macd_signal'] = signal_line
-    df["macd_hist"] = hist
-    # Adding lag features
-    df["rsi_lag1"] = df["rsi"].shift(1)
-    df["macd_hist_lag1"] = df["macd_hist"].shift(1)
-    df["close_lag1"] = df["Close"].shift(1)
-    # Adding ROC
-    df["roc"] = df["Close"].pct_change(periods=3)
-    # Adding rolling volatility
-    df["volatility"] = df["Close"].rolling(window=5).std()
-    # Adding volume based features
-    df["vol_change"] = df["Volume"].pct_change()
-    df["vol_sma10"] = df["Volume"].rolling(10).mean()
+
+# Raised when a symbol has too few usable rows to train the models
+class InsufficientDataError(ValueError):
+    pass
+
+
+FEATURE_COLUMNS = [
+    'rsi', 'sma10', 'sma20', 'sma50', 'macd_line', 'macd_signal', 'macd_hist',
+    'Volume', 'rsi_lag1', 'macd_hist_lag1', 'close_lag1', 'roc', 'volatility',
+    'vol_change', 'vol_sma10'
+]
+
+
+# Builds the feature matrix and target, reusing indicators already added by compute_indicators
+def prepare_features(df: pd.DataFrame, min_rows: int = MIN_TRAINING_ROWS) -> Tuple[pd.DataFrame, pd.Series]:
+    if not set(FEATURE_COLUMNS).issubset(df.columns):
+        df = compute_indicators(df)
     # Future returns label: 1 if next day's close > today's close
-    df["close_shift"] = df["Close"].shift(-1)
-    df["target"] = (df["close_shift"] > df["Close"] * 1.002).astype(int)
+    close_shift = df["Close"].shift(-1)
+    df = df.assign(
+        close_shift=close_shift,
+        target=(close_shift > df["Close"] * 1.002).astype(np.int8),
+    )
 
     # Droping rows with NaNs (due to indicators and shift)
-    df.dropna(inplace=True)
-    # Features
-    feature_cols = [
-        'rsi', 'sma10', 'sma20', 'sma50', 'macd_line', 'macd_signal', 'macd_hist',
-        'Volume', 'rsi_lag1', 'macd_hist_lag1', 'close_lag1', 'roc', 'volatility',
-        'vol_change', 'vol_sma10'
-    ]
-    X = df[feature_cols]
+    df = df.dropna()
+    if len(df) < min_rows:
+        raise InsufficientDataError(
+            f"only {len(df)} usable rows after dropping NaNs, at least {min_rows} required"
+        )
+    # Indicators carry far less than float64 precision, float32 halves the memory the models scan
+    X = df[FEATURE_COLUMNS].astype(np.float32)
     y = df['target']
     return X, y
 
@@ -59,24 +58,41 @@ def train_models(
     y: pd.Series,
     test_size: float = 0.3,
     random_state: int = 42,
+    n_splits: int = 5,
 ) -> Dict[str, float]:
 
-    # Time-series splitting
-    tscv = TimeSeriesSplit(n_splits=5)
+    # Time-series splitting, with fewer folds when there are not enough rows for the requested ones
+    if len(X) < 5 * n_splits:
+        n_splits = max(2, len(X) // 20)
+    tscv = TimeSeriesSplit(n_splits=n_splits)
     all_logistic_metrics = []
     all_tree_metrics = []
+    importances_list = []
+
+    # The training window only grows between folds, so the scaler is updated with the new rows
+    # and the logistic regression starts from the previous fold's coefficients
+    scaler = StandardScaler()
+    scaled_rows = 0
+    log_reg = LogisticRegression(
+        max_iter=1000,
+        solver='saga',
+        tol=1e-3,
+        class_weight='balanced',
+        warm_start=True,
+        random_state=random_state,
+    )
 
     for train_index, test_index in tscv.split(X):
         X_train, X_test = X.iloc[train_index], X.iloc[test_index]
         y_train, y_test = y.iloc[train_index], y.iloc[test_index]
 
         # Scaling features for Logistic Regression
-        scaler = StandardScaler()
-        X_train_scaled = scaler.fit_transform(X_train)
-        X_test_scaled = scaler.transform(X_test)
+        scaler.partial_fit(X_train.iloc[scaled_rows:])
+        scaled_rows = len(X_train)
+        X_train_scaled = scaler.transform(X_train).astype(np.float32, copy=False)
+        X_test_scaled = scaler.transform(X_test).astype(np.float32, copy=False)
 
         # Logistic regression model
-        log_reg = LogisticRegression(max_iter=1000, class_weight='balanced')
         log_reg.fit(X_train_scaled, y_train)
         y_pred_lr = log_reg.predict(X_test_scaled)
         logistic_accuracy = accuracy_score(y_test, y_pred_lr)
@@ -93,7 +109,9 @@ def train_models(
         })
 
         # Decision tree model
-        tree = DecisionTreeClassifier(max_depth=5, random_state=random_state, class_weight='balanced')
+        tree = DecisionTreeClassifier(
+            max_depth=5, min_samples_leaf=0.05, random_state=random_state, class_weight='balanced'
+        )
         tree.fit(X_train, y_train)
         y_pred_tree = tree.predict(X_test)
         tree_accuracy = accuracy_score(y_test, y_pred_tree)
@@ -109,12 +127,16 @@ def train_models(
             'roc_auc': tree_roc_auc,
         })
 
-        # Feature importance analysis for Decision Tree model
-        importances = tree.feature_importances_
-        features = X.columns
-        feature_importance_df = pd.DataFrame({'feature': features, 'importance': importances})
-        feature_importance_df = feature_importance_df.sort_values(by='importance', ascending=False)
-        logger.info("Decision Tree feature importances:\n%s", feature_importance_df)
+        importances_list.append(tree.feature_importances_)
+
+    # Feature importance analysis for Decision Tree model, averaged over the folds
+    if importances_list and logger.isEnabledFor(logging.INFO):
+        mean_importances = np.mean(importances_list, axis=0)
+        order = np.argsort(mean_importances)[::-1]
+        logger.info(
+            "Decision Tree feature importances: %s",
+            ", ".join(f"{X.columns[i]}={mean_importances[i]:.3f}" for i in order),
+        )
 
     avg_logistic_metrics = pd.DataFrame(all_logistic_metrics).mean().to_dict()
     avg_tree_metrics = pd.DataFrame(all_tree_metrics).mean().to_dict()
@@ -1,9 +1,15 @@
 from __future__ import annotations
 import logging
-from typing import List, Dict, Tuple
+from typing import Dict, Tuple
 import pandas as pd
 import numpy as np
-from .indicators import calculate_rsi, calculate_macd, calculate_sma
+from .indicators import RSI_PERIOD, calculate_rsi, calculate_sma
+
+try:
+    from numba import njit
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
 
 logger = logging.getLogger(__name__)
 
@@ -15,24 +21,79 @@ def generate_signals(
     long_window: int = 50,
 ) -> pd.DataFrame:
     
-    df = df.copy()
-    df["rsi"] = calculate_rsi(df["Close"], period=rsi_period)
-    df["sma_short"] = calculate_sma(df["Close"], short_window)
-    df["sma_long"] = calculate_sma(df["Close"], long_window)
-    df["ma_diff"] = df["sma_short"] - df["sma_long"]
-    df["ma_diff_prev"] = df["ma_diff"].shift(1)
-    logger.debug("DataFrame after indicator calculation:\n%s", df.tail())
-    df["signal"] = 0
+    # Indicators already added by compute_indicators are reused instead of being recalculated
+    if "rsi" in df.columns and rsi_period == RSI_PERIOD:
+        rsi = df["rsi"]
+    else:
+        rsi = calculate_rsi(df["Close"], period=rsi_period)
+    short_col = f"sma{short_window}"
+    long_col = f"sma{long_window}"
+    sma_short = df[short_col] if short_col in df.columns else calculate_sma(df["Close"], short_window)
+    sma_long = df[long_col] if long_col in df.columns else calculate_sma(df["Close"], long_window)
+    ma_diff = sma_short - sma_long
 
     # Buys when RSI is below 30, confirming a short-term dip, but only while the 20-DMA is already above the 50-DMA, confirming a broader uptrend
     buy_conditions = (
-        (df["rsi"] < 30) &      
-        (df["ma_diff"] > 0)     
+        (rsi < 30) &      
+        (ma_diff > 0)     
     )
 
-    df.loc[buy_conditions, "signal"] = 1
+    # New columns are attached in one assign instead of copying the input frame and mutating the copy
+    df = df.assign(
+        rsi=rsi,
+        sma_short=sma_short,
+        sma_long=sma_long,
+        ma_diff=ma_diff,
+        signal=buy_conditions.astype(int),
+    )
+    logger.debug("DataFrame after indicator calculation:\n%s", df.tail())
     return df
 
+# Pair every entry with the next exit bar, ignoring signals while already in a position.
+# Both pointers jump with searchsorted, so the loop runs once per trade rather than once per bar or signal.
+def _pair_trades(
+    entries: np.ndarray, exits: np.ndarray, max_trades: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    entry_idx = np.empty(max_trades, dtype=np.int64)
+    exit_idx = np.empty(max_trades, dtype=np.int64)
+    n_trades = 0
+    entry_pos = 0
+    while entry_pos < len(entries):
+        entry = entries[entry_pos]
+        exit_pos = np.searchsorted(exits, entry, side="right")
+        if exit_pos == len(exits):
+            # Entry on the final bar is never closed
+            break
+        entry_idx[n_trades] = entry
+        exit_idx[n_trades] = exits[exit_pos]
+        n_trades += 1
+        entry_pos = np.searchsorted(entries, exits[exit_pos], side="right")
+    return entry_idx[:n_trades], exit_idx[:n_trades]
+
+
+if _HAS_NUMBA:
+    # Compiled two-pointer walk over the sorted entry and exit bars
+    @njit(cache=True, nogil=True)
+    def _pair_trades_numba(entries, exits, max_trades):
+        entry_idx = np.empty(max_trades, dtype=np.int64)
+        exit_idx = np.empty(max_trades, dtype=np.int64)
+        n_trades = 0
+        exit_pos = 0
+        last_exit = -1
+        for entry in entries:
+            if entry <= last_exit:
+                continue
+            while exit_pos < exits.shape[0] and exits[exit_pos] <= entry:
+                exit_pos += 1
+            if exit_pos == exits.shape[0]:
+                break
+            last_exit = exits[exit_pos]
+            entry_idx[n_trades] = entry
+            exit_idx[n_trades] = last_exit
+            n_trades += 1
+        return entry_idx[:n_trades], exit_idx[:n_trades]
+
+
 # Backtest the trading signals and compute P&L metrics
 def backtest_signals(
     df: pd.DataFrame,
@@ -40,62 +101,57 @@ def backtest_signals(
     rsi_exit: float = 70.0,
 ) -> Tuple[pd.DataFrame, Dict[str, float]]:
 
-    trades: List[Dict[str, object]] = []
-    in_position = False
-    entry_price = 0.0
-    entry_date = None
-    shares = 0.0
-    capital = initial_capital
-
-    for i in range(len(df)):
-        row = df.iloc[i]
-        date = df.index[i]
-        price = row["Close"]
-
-        if not in_position and row["signal"] == 1:
-            entry_price = price
-            entry_date = date
-            shares = capital / entry_price
-            in_position = True
-            logger.debug("Entering position on %s at %.2f", date, price)
-            continue
-
-        if in_position:
-            rsi_val = row["rsi"]
-            ma_diff = row["ma_diff"]
-            ma_diff_prev = row["ma_diff_prev"]
-            cross_down = ma_diff_prev >= 0 and ma_diff < 0
-            overbought = rsi_val > rsi_exit
-
-            if cross_down or overbought or i == len(df) - 1:
-                exit_price = price
-                exit_date = date
-                pnl = (exit_price - entry_price) * shares
-                pnl_pct = pnl / (entry_price * shares)
-                capital += pnl
-                trades.append({
-                    "entry_date": entry_date,
-                    "exit_date": exit_date,
-                    "entry_price": entry_price,
-                    "exit_price": exit_price,
-                    "shares": shares,
-                    "pnl": pnl,
-                    "pnl_pct": pnl_pct,
-                })
-                logger.debug(
-                    "Exiting position on %s at %.2f (pnl %.2f, %.2f%%)",
-                    exit_date,
-                    exit_price,
-                    pnl,
-                    pnl_pct * 100,
-                )
-                in_position = False
-                entry_price = 0.0
-                shares = 0.0
-
-    trade_df = pd.DataFrame(trades)
-    if not trade_df.empty:
-        trade_df["pnl_pct"] = trade_df["pnl_pct"] * 100
+    close = df["Close"].to_numpy(dtype=np.float64)
+    signal = df["signal"].to_numpy(dtype=np.int64)
+    rsi = df["rsi"].to_numpy(dtype=np.float64)
+    ma_diff = df["ma_diff"].to_numpy(dtype=np.float64)
+    # Previous bar's MA difference, shifted here rather than stored as a column by generate_signals
+    ma_diff_prev = np.empty_like(ma_diff)
+    ma_diff_prev[:1] = np.nan
+    ma_diff_prev[1:] = ma_diff[:-1]
+
+    # An open position is closed on a death cross, an overbought RSI or the last bar
+    exit_mask = ((ma_diff_prev >= 0) & (ma_diff < 0)) | (rsi > rsi_exit)
+    if len(exit_mask):
+        exit_mask[-1] = True
+    entries = np.flatnonzero(signal == 1)
+    exits = np.flatnonzero(exit_mask)
+
+    # Every trade opens on a buy signal, so the signal count bounds the trade arrays
+    if _HAS_NUMBA:
+        entry_idx, exit_idx = _pair_trades_numba(entries, exits, len(entries))
+    else:
+        entry_idx, exit_idx = _pair_trades(entries, exits, len(entries))
+
+    # Every trade reinvests the full capital, so capital compounds by exit/entry per trade
+    entry_price = close[entry_idx]
+    exit_price = close[exit_idx]
+    capital_after = initial_capital * np.cumprod(exit_price / entry_price)
+    capital_before = np.concatenate(([initial_capital], capital_after[:-1]))
+    shares = capital_before / entry_price
+    pnl = (exit_price - entry_price) * shares
+    pnl_pct = (exit_price - entry_price) / entry_price
+    capital = float(capital_after[-1]) if len(capital_after) else initial_capital
+
+    trade_df = pd.DataFrame({
+        "entry_date": df.index[entry_idx],
+        "exit_date": df.index[exit_idx],
+        "entry_price": entry_price,
+        "exit_price": exit_price,
+        "shares": shares,
+        "pnl": pnl,
+        "pnl_pct": pnl_pct * 100,
+    })
+    if logger.isEnabledFor(logging.DEBUG):
+        for trade in trade_df.itertuples(index=False):
+            logger.debug("Entering position on %s at %.2f", trade.entry_date, trade.entry_price)
+            logger.debug(
+                "Exiting position on %s at %.2f (pnl %.2f, %.2f%%)",
+                trade.exit_date,
+                trade.exit_price,
+                trade.pnl,
+                trade.pnl_pct,
+            )
 
     # Summary statistics of trades
     summary = {
@@ -1,32 +1,72 @@
 import os
 import logging
+from typing import Iterable, List
 import requests
+from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
-# This function fetches the bot token and chat ID from environment variables at the time of execution.
-def send_telegram_message(message: str) -> None:
-    bot_token = os.environ.get("TELEGRAM_BOT_TOKEN")
-    chat_id = os.environ.get("TELEGRAM_CHAT_ID")
+REQUEST_TIMEOUT_SECONDS = 10
+MAX_MESSAGE_LENGTH = 4096
+MESSAGE_SEPARATOR = "\n\n"
+
+# Shared session so consecutive notifications reuse one keep-alive connection to the Bot API
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=Retry(total=3, backoff_factor=0.5)),
+)
+
+# The bot token and chat ID are read once at import. .env is loaded here because main imports this module
+# before running its own load_dotenv().
+load_dotenv()
+_BOT_TOKEN = os.environ.get("TELEGRAM_BOT_TOKEN")
+_CHAT_ID = os.environ.get("TELEGRAM_CHAT_ID")
+_URL = f"https://api.telegram.org/bot{_BOT_TOKEN}/sendMessage" if _BOT_TOKEN and _CHAT_ID else None
+
 
-    if not bot_token or not chat_id:
+def send_telegram_message(message: str) -> None:
+    if not _URL:
         logger.warning("Telegram bot token or chat ID not set. Skipping Telegram notification.")
         return
 
-    url = f"https://api.telegram.org/bot{bot_token}/sendMessage"
     payload = {
-        "chat_id": chat_id,
+        "chat_id": _CHAT_ID,
         "text": message,
         "parse_mode": "HTML"
     }
     try:
-        response = requests.post(url, data=payload)
+        response = _SESSION.post(_URL, data=payload, timeout=REQUEST_TIMEOUT_SECONDS)
         response.raise_for_status()  
         logger.debug("Telegram message sent successfully!")
     except requests.exceptions.RequestException as e:
         logger.error("Failed to send Telegram message: %s", e)
 
+# Splits a message into chunks within Telegram's length limit, preferring to break at a newline
+def _split_message(message: str) -> List[str]:
+    chunks = []
+    while len(message) > MAX_MESSAGE_LENGTH:
+        cut = message.rfind("\n", 0, MAX_MESSAGE_LENGTH + 1)
+        if cut <= 0:
+            cut = MAX_MESSAGE_LENGTH
+        chunks.append(message[:cut])
+        message = message[cut:].lstrip("\n")
+    chunks.append(message)
+    return chunks
+
+# Sends several messages with as few requests as possible by joining them up to Telegram's length limit
+def send_telegram_messages(messages: Iterable[str]) -> None:
+    batch = ""
+    for message in (chunk for msg in messages for chunk in _split_message(msg)):
+        if batch and len(batch) + len(MESSAGE_SEPARATOR) + len(message) > MAX_MESSAGE_LENGTH:
+            send_telegram_message(batch)
+            batch = message
+        else:
+            batch = f"{batch}{MESSAGE_SEPARATOR}{message}" if batch else message
+    if batch:
+        send_telegram_message(batch)
+
 if __name__ == '__main__':
-    from dotenv import load_dotenv
-    load_dotenv()
     send_telegram_message("Test message from telegram_notifier.py direct execution!")
\ No newline at end of file